@@ -1,29 +1,112 @@
 import json
-from datetime import datetime
+import orjson
+from datetime import date, datetime
 import os
 import re
+import sys
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pytz
 import winsound
 import time
 import threading
-from bs4 import BeautifulSoup
+import functools
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from bs4 import BeautifulSoup, SoupStrainer
+
+# ANSI escape codes for text formatting, only when writing to a terminal
+BOLD = '\033[1m' if sys.stdout.isatty() else ''
+END = '\033[0m' if sys.stdout.isatty() else ''
+
+# (connect, read) timeout for every HTTP request so a stalled server can't hang the tracker
+HTTP_TIMEOUT = (3.05, 10)
+
+# Longest Retry-After (seconds) we'll wait out before retrying a 503
+RETRY_AFTER_CAP = 5
+
+# Performance codes returned by analyze_performance, indexing into PERF_EMOJI for display
+COLD, AVERAGE, HOT, NO_DATA = 0, 1, 2, 3
+PERF_EMOJI = ("❄️", "➖", "🔥", "⚪")
+
+class CappedRetry(Retry):
+    """Retry policy that honors Retry-After, but never sleeps longer than RETRY_AFTER_CAP."""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, RETRY_AFTER_CAP)
 
 class SportsScoreTracker:
+    # ESPN team IDs to ESPN team names
+    TEAM_ID_MAPPINGS = {
+        '1': 'Hawks',
+        '2': 'Celtics',
+        '3': 'Nets',
+        '4': 'Hornets',
+        '5': 'Bulls',
+        '6': 'Cavaliers',
+        '7': 'Mavericks',
+        '8': 'Nuggets',
+        '9': 'Pistons',
+        '10': 'Warriors',
+        '11': 'Rockets',
+        '12': 'Pacers',
+        '13': 'Clippers',
+        '14': 'Lakers',
+        '15': 'Grizzlies',
+        '16': 'Heat',
+        '17': 'Bucks',
+        '18': 'Timberwolves',
+        '19': 'Pelicans',
+        '20': 'Knicks',
+        '21': 'Thunder',
+        '22': 'Magic',
+        '23': '76ers',
+        '24': 'Suns',
+        '25': 'Trail Blazers',
+        '26': 'Kings',
+        '27': 'Spurs',
+        '28': 'Raptors',
+        '29': 'Jazz',
+        '30': 'Wizards'
+    }
+
+    # teamrankings.com stats live in a table, so only tables need parsing. This is not narrowed
+    # to the tr-table class: the strainer would compare the whole class attribute, missing
+    # tables like class="tr-table datatable scrollable" that find() below matches.
+    STATS_TABLE = SoupStrainer('table')
+
     def __init__(self):
         """Initialize the score tracker."""
         self.scores_file = 'scores.json'
         self.scores = self.load_scores()
+        self.averages_file = 'nba_averages_cache.json'
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
+        # Keep-alive pools shared by the ESPN poll and the teamrankings fetches,
+        # retrying transient server errors with backoff. read=False turns off retries for
+        # every read error, not just read timeouts (a connection reset on a stale keep-alive
+        # connection fails too), so a timeout still surfaces as requests' Timeout. Rate limits
+        # (429) are left to the next poll or refresh rather than retried straight away.
+        retry = CappedRetry(total=3, read=False, backoff_factor=0.3,
+                            status_forcelist=[500, 502, 503, 504])
+        self.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
         self.nba_halftime_averages = {}  # Cache for NBA halftime averages
         self.nba_second_half_averages = {}  # Cache for NBA second half averages
         self.last_averages_update = None
-        # ANSI escape codes for text formatting
-        self.BOLD = '\033[1m'
-        self.END = '\033[0m'
+        self._averages_validators = {}  # URL -> (ETag, Last-Modified) from the last teamrankings fetch
+        # Last ESPN scoreboard payload and its validators for conditional polling
+        self._scoreboard_cached_data = None
+        self._scoreboard_etag = None
+        self._scoreboard_lastmod = None
+        # Rendered lines for completed games, keyed by ESPN event ID
+        self._final_line_cache = {}
+        self._final_line_cache_date = date.today()
+        self.verbose = False  # Print per-team debug output when refreshing averages
         
         # NBA team name mappings (ESPN names to teamrankings.com city names)
         self.nba_team_mappings = {
@@ -58,52 +141,93 @@ class SportsScoreTracker:
             'Jazz': 'Utah',
             'Wizards': 'Washington'
         }
-        self.update_nba_halftime_averages()  # Initial fetch of averages
+        # ESPN team ID straight to teamrankings.com city name
+        self._id_to_city = {
+            team_id: self.nba_team_mappings[name] for team_id, name in self.TEAM_ID_MAPPINGS.items()
+        }
+        # Lowercased ESPN names for the fallback substring search
+        self._name_keywords_lower = tuple((key.lower(), city) for key, city in self.nba_team_mappings.items())
+        # Shared by every averages refresh and shut down with the tracker
+        self._stop = threading.Event()
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        # Team stats only change when the averages are refreshed
+        self._cached_team_stats = functools.lru_cache(maxsize=128)(self._lookup_team_stats)
+        # Bumped by each averages refresh; the monitor loop clears its caches when it changes
+        self._averages_generation = 0
+        self._cache_generation = 0
+        
+        # Start from the on-disk averages when they are recent enough, otherwise fetch now
+        self.load_averages()
+        initial_ok = True
+        if (not self.last_averages_update or
+            not self.nba_halftime_averages or not self.nba_second_half_averages or
+            (datetime.now() - self.last_averages_update).total_seconds() > 86400):
+            initial_ok = self.update_nba_halftime_averages()  # Initial fetch of averages
+        
+        # Refresh averages hourly in the background so the monitor loop never blocks on it
+        if not initial_ok:
+            first_refresh = 60  # Retry a failed initial fetch soon
+        elif self.last_averages_update:
+            age = (datetime.now() - self.last_averages_update).total_seconds()
+            first_refresh = max(0, 3600 - age)
+        else:
+            first_refresh = 3600
+        threading.Thread(target=self._refresh_loop, args=(first_refresh,), daemon=True).start()
+
+    def _refresh_loop(self, delay):
+        """Refresh NBA averages once per hour until stopped, retrying failures after a minute."""
+        while not self._stop.wait(delay):
+            delay = 3600 if self.update_nba_halftime_averages() else 60
 
     def update_nba_halftime_averages(self):
-        """Fetch NBA team halftime scoring averages from teamrankings.com"""
+        """Fetch NBA team halftime and second half scoring averages from teamrankings.com.
+        Returns True if both sets of averages were refreshed."""
+        # Both pages are independent, so fetch them concurrently
         try:
-            print("Fetching NBA halftime averages...")
-            url = "https://www.teamrankings.com/nba/stat/1st-half-points-per-game"
-            response = self.session.get(url)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Find any table with the tr-table class
-            table = soup.find('table', {'class': 'tr-table'})
-            if table:
-                rows = table.find_all('tr')[1:]  # Skip header row
-                for row in rows:
-                    cols = row.find_all('td')
-                    if len(cols) >= 3:  # Make sure we have enough columns
-                        team_name = cols[1].text.strip()
-                        try:
-                            avg_score = float(cols[2].text.strip())
-                            self.nba_halftime_averages[team_name] = avg_score
-                            print(f"Added {team_name}: {avg_score}")
-                        except ValueError as e:
-                            print(f"Error parsing score for {team_name}: {e}")
-                
-                self.last_averages_update = datetime.now()
-                print(f"Updated NBA halftime averages. Found {len(self.nba_halftime_averages)} teams.")
-                
-                # Debug: print all team names in our averages
-                print("\nTeam names in averages:")
-                for team in sorted(self.nba_halftime_averages.keys()):
-                    print(f"  {team}")
-            else:
-                print("Error: Could not find stats table")
-                print("Available tables:", [t.get('class', ['no-class']) for t in soup.find_all('table')])
-        except Exception as e:
-            print(f"Error updating NBA halftime averages: {str(e)}")
-            if 'response' in locals():
-                print(f"Response status: {response.status_code}")
-                print(f"Response content: {response.text[:500]}...")  # Print first 500 chars
+            halftime = self._executor.submit(
+                self._fetch_avg, "halftime",
+                "https://www.teamrankings.com/nba/stat/1st-half-points-per-game",
+                self.nba_halftime_averages
+            )
+            second_half = self._executor.submit(
+                self._fetch_avg, "second half",
+                "https://www.teamrankings.com/nba/stat/2nd-half-points-per-game",
+                self.nba_second_half_averages
+            )
+            halftime_ok = halftime.result()
+            second_half_ok = second_half.result()
+        except (RuntimeError, CancelledError):
+            # The executor is shut down once the tracker is stopping
+            if self._stop.is_set():
+                return False
+            raise
+
+        if halftime_ok:
+            self.last_averages_update = datetime.now()
+            # Only persist a complete set, so a partial fetch is never mistaken for a fresh cache
+            if self.nba_halftime_averages and self.nba_second_half_averages:
+                self.save_averages()
+        # Tell the monitor loop to drop stats and lines computed from the old averages
+        self._averages_generation += 1
+        return halftime_ok and second_half_ok
 
+    def _fetch_avg(self, label, url, target_dict):
+        """Fetch one teamrankings.com stat page into target_dict. Returns True on success."""
         try:
-            print("Fetching NBA second half averages...")
-            url = "https://www.teamrankings.com/nba/stat/2nd-half-points-per-game"
-            response = self.session.get(url)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            print(f"Fetching NBA {label} averages...")
+            # Ask for the page only if it changed since our last fetch
+            etag, last_modified = self._averages_validators.get(url, (None, None))
+            headers = {}
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+            response = self.session.get(url, headers=headers, timeout=HTTP_TIMEOUT)
+            if response.status_code == 304:
+                print(f"NBA {label} averages unchanged.")
+                return True
+            # Only build a tree for the page's tables, not the whole page
+            soup = BeautifulSoup(response.text, 'lxml', parse_only=self.STATS_TABLE)
             
             # Find any table with the tr-table class
             table = soup.find('table', {'class': 'tr-table'})
@@ -115,79 +239,50 @@ class SportsScoreTracker:
                         team_name = cols[1].text.strip()
                         try:
                             avg_score = float(cols[2].text.strip())
-                            self.nba_second_half_averages[team_name] = avg_score
-                            print(f"Added {team_name}: {avg_score}")
+                            target_dict[team_name] = avg_score
+                            if self.verbose:
+                                print(f"Added {team_name}: {avg_score}")
                         except ValueError as e:
                             print(f"Error parsing score for {team_name}: {e}")
                 
-                print(f"Updated NBA second half averages. Found {len(self.nba_second_half_averages)} teams.")
+                print(f"Updated NBA {label} averages. Found {len(target_dict)} teams.")
+                self._averages_validators[url] = (
+                    response.headers.get('ETag'), response.headers.get('Last-Modified')
+                )
                 
                 # Debug: print all team names in our averages
-                print("\nTeam names in averages:")
-                for team in sorted(self.nba_second_half_averages.keys()):
-                    print(f"  {team}")
+                if self.verbose:
+                    print("\nTeam names in averages:")
+                    for team in sorted(target_dict.keys()):
+                        print(f"  {team}")
+                return True
             else:
                 print("Error: Could not find stats table")
                 print("Available tables:", [t.get('class', ['no-class']) for t in soup.find_all('table')])
+        except requests.exceptions.Timeout:
+            print(f"Timed out fetching NBA {label} averages")
         except Exception as e:
-            print(f"Error updating NBA second half averages: {str(e)}")
+            print(f"Error updating NBA {label} averages: {str(e)}")
             if 'response' in locals():
                 print(f"Response status: {response.status_code}")
                 print(f"Response content: {response.text[:500]}...")  # Print first 500 chars
+        return False
 
     def get_team_stats(self, team_id, second_half=False):
         """Get team's average halftime score."""
+        return self._cached_team_stats(team_id, second_half)
+
+    def _lookup_team_stats(self, team_id, second_half):
+        """Uncached lookup behind get_team_stats."""
         try:
-            # Update averages once per hour
-            if (not self.last_averages_update or 
-                (datetime.now() - self.last_averages_update).total_seconds() > 3600):
-                self.update_nba_halftime_averages()
-            
-            # Get team name from ESPN data
-            team_name = None
-            
-            # First try to find by team ID mapping
-            team_id_mappings = {
-                '1': 'Hawks',
-                '2': 'Celtics',
-                '3': 'Nets',
-                '4': 'Hornets',
-                '5': 'Bulls',
-                '6': 'Cavaliers',
-                '7': 'Mavericks',
-                '8': 'Nuggets',
-                '9': 'Pistons',
-                '10': 'Warriors',
-                '11': 'Rockets',
-                '12': 'Pacers',
-                '13': 'Clippers',
-                '14': 'Lakers',
-                '15': 'Grizzlies',
-                '16': 'Heat',
-                '17': 'Bucks',
-                '18': 'Timberwolves',
-                '19': 'Pelicans',
-                '20': 'Knicks',
-                '21': 'Thunder',
-                '22': 'Magic',
-                '23': '76ers',
-                '24': 'Suns',
-                '25': 'Trail Blazers',
-                '26': 'Kings',
-                '27': 'Spurs',
-                '28': 'Raptors',
-                '29': 'Jazz',
-                '30': 'Wizards'
-            }
-            
             # Try to get team name from ID first
-            if team_id in team_id_mappings:
-                team_name = self.nba_team_mappings[team_id_mappings[team_id]]
-            else:
+            team_name = self._id_to_city.get(team_id)
+            if team_name is None:
                 # Fallback to searching by name
-                for key in self.nba_team_mappings.keys():
-                    if key.lower() in team_id.lower():
-                        team_name = self.nba_team_mappings[key]
+                team_id_lower = team_id.lower()
+                for key_lower, city in self._name_keywords_lower:
+                    if key_lower in team_id_lower:
+                        team_name = city
                         break
             
             if not team_name:
@@ -209,25 +304,23 @@ class SportsScoreTracker:
             return None
 
     def analyze_performance(self, current_score, avg_score_per_game):
-        """Compare current score with average scoring."""
+        """Compare current score with average scoring. Returns a performance code."""
         if not avg_score_per_game:
-            return "⚪"  # Grey circle for no data
+            return NO_DATA  # Grey circle for no data
 
-        current_score = float(current_score)
-        expected_score = float(avg_score_per_game)
-        diff_percentage = ((current_score - expected_score) / expected_score) * 100
-        
-        if diff_percentage >= 5:
-            return "🔥"  # Fire for hot
-        elif diff_percentage <= -5:
-            return "❄️"  # Snowflake for cold
-        return "➖"  # Dash for average
+        # Within 5% either side of the average counts as average
+        if current_score >= avg_score_per_game * 1.05:
+            return HOT  # Fire for hot
+        elif current_score <= avg_score_per_game * 0.95:
+            return COLD  # Snowflake for cold
+        return AVERAGE  # Dash for average
 
     def get_halftime_score(self, competitor):
         """Get the halftime score for a team."""
         try:
-            if 'linescores' in competitor and len(competitor['linescores']) >= 2:
-                return sum(float(score.get('value', 0)) for score in competitor['linescores'][:2])
+            linescores = competitor.get('linescores')
+            if linescores and len(linescores) >= 2:
+                return float(linescores[0].get('value', 0)) + float(linescores[1].get('value', 0))
         except Exception as e:
             print(f"Error getting halftime score: {str(e)}")
         return None
@@ -239,9 +332,39 @@ class SportsScoreTracker:
         
         while True:
             try:
+                poll_started = time.monotonic()
+                # Drop yesterday's final games once the day rolls over
+                if self._final_line_cache_date != date.today():
+                    self._final_line_cache.clear()
+                    self._final_line_cache_date = date.today()
+                # Drop cached stats and lines once the averages have been refreshed. Clearing
+                # here rather than in the refresh thread means an entry computed from the old
+                # averages can't be stored after the clear.
+                generation = self._averages_generation
+                if self._cache_generation != generation:
+                    self._cached_team_stats.cache_clear()
+                    self._final_line_cache.clear()
+                    self._cache_generation = generation
                 try:
-                    response = requests.get('https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard')
-                    data = response.json()
+                    # Ask for the scoreboard only if it changed since the last poll
+                    headers = {}
+                    if self._scoreboard_etag:
+                        headers['If-None-Match'] = self._scoreboard_etag
+                    if self._scoreboard_lastmod:
+                        headers['If-Modified-Since'] = self._scoreboard_lastmod
+                    response = self.session.get(
+                        'https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard',
+                        headers=headers,
+                        timeout=HTTP_TIMEOUT
+                    )
+                    if response.status_code == 304 and self._scoreboard_cached_data is not None:
+                        data = self._scoreboard_cached_data
+                    else:
+                        data = orjson.loads(response.content)
+                        if response.status_code == 200:
+                            self._scoreboard_cached_data = data
+                            self._scoreboard_etag = response.headers.get('ETag')
+                            self._scoreboard_lastmod = response.headers.get('Last-Modified')
 
                     if 'events' in data:
                         # Filter games that have reached at least halftime
@@ -294,11 +417,11 @@ class SportsScoreTracker:
                                 away_perf = self.analyze_performance(game['away_halftime'], away_stats)
                                 
                                 game_status = event['status']['type']['detail']
-                                game_line = f"{away_team['team']['name']} {game['away_halftime']} {away_perf} @ {home_team['team']['name']} {game['home_halftime']} {home_perf} - {game_status}"
+                                game_line = f"{away_team['team']['name']} {game['away_halftime']} {PERF_EMOJI[away_perf]} @ {home_team['team']['name']} {game['home_halftime']} {PERF_EMOJI[home_perf]} - {game_status}"
                                 
                                 # Highlight if both teams are hot or both are cold
-                                if (home_perf == "🔥" and away_perf == "🔥") or (home_perf == "❄️" and away_perf == "❄️"):
-                                    game_line = f"{self.BOLD}{game_line}{self.END}"
+                                if BOLD and ((home_perf == HOT and away_perf == HOT) or (home_perf == COLD and away_perf == COLD)):
+                                    game_line = f"{BOLD}{game_line}{END}"
                                 
                                 print(game_line)
                         
@@ -312,6 +435,13 @@ class SportsScoreTracker:
                             
                             for game in completed_games:
                                 event = game['event']
+                                
+                                # Final games never change, so reuse their rendered line
+                                cached_line = self._final_line_cache.get(event['id'])
+                                if cached_line is not None:
+                                    print(cached_line)
+                                    continue
+                                
                                 home_team = game['home_team']
                                 away_team = game['away_team']
                                 
@@ -325,53 +455,55 @@ class SportsScoreTracker:
                                 home_second_half = home_final - home_halftime
                                 away_second_half = away_final - away_halftime
                                 
+                                # Look up each team's averages once per game
+                                home_id = home_team['team']['id']
+                                away_id = away_team['team']['id']
+                                home_first_avg = self.get_team_stats(home_id)
+                                home_second_avg = self.get_team_stats(home_id, second_half=True)
+                                away_first_avg = self.get_team_stats(away_id)
+                                away_second_avg = self.get_team_stats(away_id, second_half=True)
+                                
                                 # Get performance for both halves
-                                home_first_perf = self.analyze_performance(
-                                    home_halftime, 
-                                    self.get_team_stats(home_team['team']['id'])
-                                )
-                                away_first_perf = self.analyze_performance(
-                                    away_halftime, 
-                                    self.get_team_stats(away_team['team']['id'])
-                                )
-                                home_second_perf = self.analyze_performance(
-                                    home_second_half, 
-                                    self.get_team_stats(home_team['team']['id'], second_half=True)
-                                )
-                                away_second_perf = self.analyze_performance(
-                                    away_second_half, 
-                                    self.get_team_stats(away_team['team']['id'], second_half=True)
-                                )
+                                home_first_perf = self.analyze_performance(home_halftime, home_first_avg)
+                                away_first_perf = self.analyze_performance(away_halftime, away_first_avg)
+                                home_second_perf = self.analyze_performance(home_second_half, home_second_avg)
+                                away_second_perf = self.analyze_performance(away_second_half, away_second_avg)
                                 
                                 game_line = (
                                     f"{away_team['team']['name']} {away_halftime}/{away_second_half} "
-                                    f"{away_first_perf}/{away_second_perf} @ "
+                                    f"{PERF_EMOJI[away_first_perf]}/{PERF_EMOJI[away_second_perf]} @ "
                                     f"{home_team['team']['name']} {home_halftime}/{home_second_half} "
-                                    f"{home_first_perf}/{home_second_perf} - FINAL"
+                                    f"{PERF_EMOJI[home_first_perf]}/{PERF_EMOJI[home_second_perf]} - FINAL"
                                 )
                                 
                                 # Highlight if both teams are hot or both are cold in either half
-                                if ((home_first_perf == "🔥" and away_first_perf == "🔥") or 
-                                    (home_first_perf == "❄️" and away_first_perf == "❄️") or
-                                    (home_second_perf == "🔥" and away_second_perf == "🔥") or 
-                                    (home_second_perf == "❄️" and away_second_perf == "❄️")):
-                                    game_line = f"{self.BOLD}{game_line}{self.END}"
+                                if BOLD and ((home_first_perf == HOT and away_first_perf == HOT) or
+                                             (home_first_perf == COLD and away_first_perf == COLD) or
+                                             (home_second_perf == HOT and away_second_perf == HOT) or
+                                             (home_second_perf == COLD and away_second_perf == COLD)):
+                                    game_line = f"{BOLD}{game_line}{END}"
                                 
+                                self._final_line_cache[event['id']] = game_line
                                 print(game_line)
                             
                         if not games_found:
                             print("\nNo NBA games with halftime scores available")
                     
+                except requests.exceptions.Timeout:
+                    print("Timed out fetching NBA scores")
                 except Exception as e:
                     print(f"Error fetching NBA scores: {str(e)}")
                 
                 print("\nPress Ctrl+C to exit")
                 print(f"\nLast updated: {datetime.now().strftime('%I:%M:%S %p')}")
-                time.sleep(30)  # Wait 30 seconds before next update
+                # Keep a steady 30 second cadence regardless of how long the poll took
+                time.sleep(max(0, 30 - (time.monotonic() - poll_started)))
                 os.system('cls' if os.name == 'nt' else 'clear')  # Clear screen for next update
                 
             except KeyboardInterrupt:
                 print("\nStopping score monitoring...")
+                self._stop.set()
+                self._executor.shutdown(wait=False, cancel_futures=True)
                 break
 
     def load_scores(self):
@@ -383,6 +515,34 @@ class SportsScoreTracker:
                 return []
         return []
 
+    def load_averages(self):
+        """Load cached NBA averages from disk, if present."""
+        if not os.path.exists(self.averages_file):
+            return
+        try:
+            with open(self.averages_file, 'rb') as f:
+                cache = orjson.loads(f.read())
+            self.nba_halftime_averages.update(cache['halftime'])
+            self.nba_second_half_averages.update(cache['second_half'])
+            self.last_averages_update = datetime.fromisoformat(cache['fetched_at'])
+        except (OSError, orjson.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            print(f"Error loading cached NBA averages: {str(e)}")
+
+    def save_averages(self):
+        """Write the current NBA averages to disk."""
+        cache = {
+            'halftime': self.nba_halftime_averages,
+            'second_half': self.nba_second_half_averages,
+            'fetched_at': self.last_averages_update.isoformat()
+        }
+        try:
+            tmp_file = self.averages_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(orjson.dumps(cache))
+            os.replace(tmp_file, self.averages_file)
+        except OSError as e:
+            print(f"Error saving NBA averages cache: {str(e)}")
+
 if __name__ == "__main__":
     tracker = SportsScoreTracker()
     tracker.monitor_scores()